@@ -17,48 +17,82 @@ TELEGRAM_TOKEN = os.getenv('TELEGRAM_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 
 RETRY_PERIOD = 600
+MAX_RETRY_PERIOD = 3600
 ENDPOINT = 'https://practicum.yandex.ru/api/user_api/homework_statuses/'
 HEADERS = {'Authorization': f'OAuth {PRACTICUM_TOKEN}'}
+REQUEST_TIMEOUT = (5, 30)
+CACHE_VALIDATORS = {'ETag': 'If-None-Match',
+                    'Last-Modified': 'If-Modified-Since'}
 
 HOMEWORK_VERDICTS = {
     'approved': 'Работа проверена: ревьюеру всё понравилось. Ура!',
     'reviewing': 'Работа взята на проверку ревьюером.',
     'rejected': 'Работа проверена: у ревьюера есть замечания.'
 }
+STATUS_TEMPLATES = {
+    status: f'Изменился статус проверки работы "{{}}". {verdict}'
+    for status, verdict in HOMEWORK_VERDICTS.items()
+}
+
+# Валидаторы кэша последнего ответа API по from_date, для которого
+# они получены: для другого from_date это уже другой ресурс.
+conditional_headers = {}
 
 
 def check_tokens():
     """Проверяет доступность переменных окружения."""
-    ENV_VARS = {'PRACTICUM_TOKEN': PRACTICUM_TOKEN,
-                'TELEGRAM_TOKEN': TELEGRAM_TOKEN,
-                'TELEGRAM_CHAT_ID': TELEGRAM_CHAT_ID}
-    none_count = 0
-    for key, value in ENV_VARS.items():
+    env_vars = (('PRACTICUM_TOKEN', PRACTICUM_TOKEN),
+                ('TELEGRAM_TOKEN', TELEGRAM_TOKEN),
+                ('TELEGRAM_CHAT_ID', TELEGRAM_CHAT_ID))
+    if all(value is not None for _, value in env_vars):
+        return
+    for key, value in env_vars:
         if value is None:
-            none_count += 1
             logging.critical(
-                f'Отсутствует обязательная переменная окружения: "{key}". '
-                'Программа принудительно остановлена.')
-    if none_count != 0:
-        sys.exit()
+                'Отсутствует обязательная переменная окружения: "%s". '
+                'Программа принудительно остановлена.', key)
+    sys.exit()
 
 
 def send_message(bot, message):
     """Отправляет сообщение в Telegram чат."""
     try:
-        bot.send_message(TELEGRAM_CHAT_ID, message)
+        try:
+            bot.send_message(TELEGRAM_CHAT_ID, message)
+        except telegram.error.RetryAfter as error:
+            logging.warning(
+                'Превышен лимит сообщений Telegram, повторная отправка '
+                'через %s с.', error.retry_after
+            )
+            time.sleep(error.retry_after)
+            bot.send_message(TELEGRAM_CHAT_ID, message)
         logging.debug('Сообщение успешно отправлено.')
     except Exception:
         logging.error('Сбой при отправке сообщения.')
 
 
 def get_api_answer(timestamp):
-    """Возвращает ответ API, приведенный к типам даных Python."""
+    """Возвращает ответ API, приведенный к типам даных Python.
+
+    Если с прошлого запроса данные не изменились (код ответа 304),
+    возвращает None.
+    """
     payload = {'from_date': timestamp}
     try:
-        response = requests.get(url=ENDPOINT, headers=HEADERS, params=payload)
+        response = requests.get(
+            url=ENDPOINT,
+            headers={**HEADERS, **conditional_headers.get(timestamp, {})},
+            params=payload,
+            timeout=REQUEST_TIMEOUT
+        )
+    except requests.Timeout as error:
+        raise Exception(
+            f'Эндпоинт {ENDPOINT} не ответил за отведенное время.'
+        ) from error
     except Exception:
         raise Exception(f'Эндпоинт {ENDPOINT} недоступен.')
+    if response.status_code == HTTPStatus.NOT_MODIFIED:
+        return None
     if response.status_code == HTTPStatus.BAD_REQUEST:
         raise APIAnswerException('Неверный формат from_date.')
     if response.status_code == HTTPStatus.UNAUTHORIZED:
@@ -70,7 +104,14 @@ def get_api_answer(timestamp):
             f'Сбой в работе программы: Эндпоинт {ENDPOINT} '
             f'недоступен. Код ответа API: {response.status_code}.'
         )
-    return response.json()
+    homework_statuses = response.json()
+    conditional_headers.clear()
+    conditional_headers[timestamp] = {
+        request_header: response.headers[header]
+        for header, request_header in CACHE_VALIDATORS.items()
+        if header in response.headers
+    }
+    return homework_statuses
 
 
 def check_response(response):
@@ -90,10 +131,10 @@ def check_response(response):
         )
     if 'current_date' not in response:
         raise KeyError('В ответе API отсутствует ключ "current_date".')
-    if len(homeworks) == 0:
+    if not homeworks:
         logging.debug('В ответе отсутствуют новые статусы.')
-    else:
-        return homeworks[0]
+        return None
+    return homeworks[0]
 
 
 def parse_status(homework):
@@ -101,15 +142,13 @@ def parse_status(homework):
     if 'homework_name' not in homework:
         raise KeyError('Отсутствует ключ "homework_name".')
     homework_name = homework['homework_name']
-    if 'status' not in homework:
-        raise KeyError('Отсутствует ключ "status".')
-    status = homework['status']
-    if status not in HOMEWORK_VERDICTS:
+    template = STATUS_TEMPLATES.get(homework.get('status'))
+    if template is None:
         raise Exception(
-            'API возвращает недокументированный статус домашней работы.'
+            'API возвращает недокументированный статус домашней работы '
+            'либо домашнюю работу без статуса.'
         )
-    verdict = HOMEWORK_VERDICTS[status]
-    return f'Изменился статус проверки работы "{homework_name}". {verdict}'
+    return template.format(homework_name)
 
 
 def main():
@@ -117,22 +156,30 @@ def main():
     check_tokens()
     bot = telegram.Bot(token=TELEGRAM_TOKEN)
     timestamp = 0
+    conditional_headers.clear()
     current_error = ''
+    retry_period = RETRY_PERIOD
     while True:
         try:
             response = get_api_answer(timestamp)
-            homework = check_response(response)
-            if homework:
-                message = parse_status(homework)
-                send_message(bot, message)
-            timestamp = response['current_date']
+            if response is None:
+                logging.debug('Ответ API не изменился.')
+            else:
+                homework = check_response(response)
+                if homework:
+                    message = parse_status(homework)
+                    send_message(bot, message)
+                    timestamp = response['current_date']
+            retry_period = RETRY_PERIOD
         except Exception as error:
+            conditional_headers.clear()
             message = f'Сбой в работе программы: {error}'
             logging.error(message)
             if current_error != str(error):
                 current_error = str(error)
                 send_message(bot, message)
-        time.sleep(RETRY_PERIOD)
+            retry_period = min(retry_period * 2, MAX_RETRY_PERIOD)
+        time.sleep(retry_period)
 
 
 if __name__ == '__main__':
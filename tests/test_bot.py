@@ -208,6 +208,30 @@ class TestHomework:
         except Exception:
             pass
 
+    def test_request_call_with_timeout(self, monkeypatch, random_timestamp,
+                                       current_timestamp, homework_module):
+        func_name = 'get_api_answer'
+        request_kwargs = []
+
+        def mock_response_get(*args, **kwargs):
+            request_kwargs.append(kwargs)
+            return utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+
+        monkeypatch.setattr(requests, 'get', mock_response_get)
+        homework_module.get_api_answer(current_timestamp)
+        assert 'timeout' in request_kwargs[0], (
+            f'Проверьте, что в функции `{func_name}` запрос к API '
+            'отправляется с параметром `timeout`.'
+        )
+        assert (
+            request_kwargs[0]['timeout'] == homework_module.REQUEST_TIMEOUT
+        ), (
+            'Проверьте, что в запрос к API передано значение '
+            '`REQUEST_TIMEOUT`.'
+        )
+
     def test_get_api_answers(self, monkeypatch, random_timestamp,
                              current_timestamp, homework_module):
         func_name = 'get_api_answer'
@@ -279,6 +303,132 @@ class TestHomework:
         except Exception:
             pass
 
+    def test_get_api_answer_with_timeout(self, current_timestamp,
+                                         monkeypatch, homework_module):
+        func_name = 'get_api_answer'
+
+        def mock_request_get_with_timeout(*args, **kwargs):
+            raise requests.Timeout('Read timed out')
+
+        monkeypatch.setattr(requests, 'get', mock_request_get_with_timeout)
+        try:
+            homework_module.get_api_answer(current_timestamp)
+        except requests.Timeout as e:
+            raise AssertionError(
+                f'Убедитесь, что в функции `{func_name}` обрабатывается '
+                'исключение `requests.Timeout`.'
+            ) from e
+        except Exception as e:
+            assert 'не ответил за отведенное время' in str(e), (
+                f'Убедитесь, что функция `{func_name}` сообщает о превышении '
+                'времени ожидания ответа API.'
+            )
+            assert isinstance(e.__cause__, requests.Timeout), (
+                f'Убедитесь, что функция `{func_name}` сохраняет исходное '
+                'исключение `requests.Timeout` в цепочке исключений.'
+            )
+        else:
+            raise AssertionError(
+                f'Убедитесь, что функция `{func_name}` выбрасывает '
+                'исключение, если API не ответил за отведенное время.'
+            )
+
+    def test_get_api_answer_not_modified(self, monkeypatch, random_timestamp,
+                                         current_timestamp, homework_module):
+        func_name = 'get_api_answer'
+        monkeypatch.setattr(homework_module, 'conditional_headers', {})
+        monkeypatch.setattr(
+            requests,
+            'get',
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.NOT_MODIFIED,
+                data={}
+            )
+        )
+        result = homework_module.get_api_answer(current_timestamp)
+        assert result is None, (
+            'Проверьте, что при ответе API с кодом 304 функция '
+            f'`{func_name}` возвращает `None`.'
+        )
+
+    def test_get_api_answer_sends_cache_validators(self, monkeypatch,
+                                                   random_timestamp,
+                                                   current_timestamp,
+                                                   homework_module):
+        func_name = 'get_api_answer'
+        etag = '"a1b2c3"'
+        last_modified = 'Wed, 21 Oct 2015 07:28:00 GMT'
+        sent_headers = []
+
+        def mock_response_get(*args, **kwargs):
+            sent_headers.append(kwargs['headers'])
+            response = utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+            response.headers = {'ETag': etag, 'Last-Modified': last_modified}
+            return response
+
+        monkeypatch.setattr(homework_module, 'conditional_headers', {})
+        monkeypatch.setattr(requests, 'get', mock_response_get)
+        homework_module.get_api_answer(current_timestamp)
+        homework_module.get_api_answer(current_timestamp)
+        homework_module.get_api_answer(current_timestamp + 1)
+
+        assert 'If-None-Match' not in sent_headers[0], (
+            f'Проверьте, что первый запрос в функции `{func_name}` '
+            'отправляется без заголовка `If-None-Match`.'
+        )
+        assert sent_headers[1].get('If-None-Match') == etag, (
+            f'Проверьте, что функция `{func_name}` передает `ETag` '
+            'из прошлого ответа в заголовке `If-None-Match`.'
+        )
+        assert sent_headers[1].get('If-Modified-Since') == last_modified, (
+            f'Проверьте, что функция `{func_name}` передает `Last-Modified` '
+            'из прошлого ответа в заголовке `If-Modified-Since`.'
+        )
+        assert sent_headers[1]['Authorization'].startswith('OAuth '), (
+            'Проверьте, что заголовок `Authorization` передается вместе '
+            'с заголовками условного запроса.'
+        )
+        assert 'If-None-Match' not in sent_headers[2], (
+            f'Проверьте, что функция `{func_name}` не передает `ETag`, '
+            'полученный для другого значения `from_date`.'
+        )
+
+    def test_get_api_answer_undecodable_body(self, monkeypatch,
+                                             random_timestamp,
+                                             current_timestamp,
+                                             homework_module):
+        func_name = 'get_api_answer'
+
+        def mock_response_get(*args, **kwargs):
+            response = utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+            response.headers = {'ETag': '"a1b2c3"'}
+            response.json = mock_json
+            return response
+
+        def mock_json():
+            raise ValueError('Invalid JSON')
+
+        monkeypatch.setattr(homework_module, 'conditional_headers', {})
+        monkeypatch.setattr(requests, 'get', mock_response_get)
+        try:
+            homework_module.get_api_answer(current_timestamp)
+        except Exception:
+            pass
+        else:
+            raise AssertionError(
+                f'Убедитесь, что функция `{func_name}` выбрасывает '
+                'исключение, если тело ответа API не удается разобрать.'
+            )
+        assert not homework_module.conditional_headers, (
+            f'Убедитесь, что функция `{func_name}` не сохраняет `ETag` '
+            'ответа, тело которого не удалось разобрать.'
+        )
+
     def test_parse_status_with_expected_statuses(self, homework_module):
         func_name = 'parse_status'
         utils.check_function(
@@ -491,6 +641,49 @@ class TestHomework:
                 'метод бота `send_message`.'
             )
 
+    def test_send_message_retries_after_flood_control(self, monkeypatch,
+                                                      caplog,
+                                                      homework_module):
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        func_name = 'send_message'
+        retry_after = 5
+        slept = []
+        monkeypatch.setattr(time, 'sleep', slept.append)
+
+        class MockedBotWithFloodControl(utils.MockTelegramBot):
+            def __init__(self, failures, **kwargs):
+                super().__init__(**kwargs)
+                self.failures = failures
+                self.calls = 0
+
+            def send_message(self, *args, **kwargs):
+                self.calls += 1
+                if self.calls <= self.failures:
+                    raise telegram.error.RetryAfter(retry_after)
+                super().send_message(*args, **kwargs)
+
+        bot = MockedBotWithFloodControl(failures=1)
+        homework_module.send_message(bot, 'Test_message_check')
+        assert slept == [retry_after], (
+            f'Убедитесь, что при `RetryAfter` функция `{func_name}` ждет '
+            'указанное Telegram время перед повторной отправкой.'
+        )
+        assert bot.calls == 2 and bot.is_message_sent, (
+            f'Убедитесь, что после `RetryAfter` функция `{func_name}` '
+            'повторно отправляет сообщение.'
+        )
+
+        bot = MockedBotWithFloodControl(failures=2)
+        with utils.check_logging(caplog, level=logging.ERROR, message=(
+                'Убедитесь, что повторный `RetryAfter` логируется с уровнем '
+                '`ERROR`.'
+        )):
+            homework_module.send_message(bot, 'Test_message_check')
+        assert bot.calls == 2, (
+            f'Убедитесь, что после `RetryAfter` функция `{func_name}` '
+            'повторяет отправку только один раз.'
+        )
+
     def test_bot_initialized_in_main(self, homework_module):
         func_name = 'main'
         utils.check_function(
@@ -772,6 +965,167 @@ class TestHomework:
                     'возникновении ошибки отправки сообщения в Телеграм.'
                 ) from e
 
+    def test_main_skips_checks_when_not_modified(self, monkeypatch,
+                                                 random_timestamp,
+                                                 current_timestamp,
+                                                 random_message,
+                                                 homework_module):
+        self.mock_main(
+            monkeypatch,
+            random_message,
+            random_timestamp,
+            current_timestamp,
+            homework_module
+        )
+        monkeypatch.setattr(
+            requests,
+            'get',
+            create_mock_response_get_with_custom_status_and_data(
+                random_timestamp=random_timestamp,
+                http_status=HTTPStatus.NOT_MODIFIED,
+                data={}
+            )
+        )
+        checked_responses = []
+        monkeypatch.setattr(
+            homework_module,
+            'check_response',
+            checked_responses.append
+        )
+        try:
+            homework_module.main()
+        except utils.BreakInfiniteLoop:
+            pass
+        assert not checked_responses, (
+            'Убедитесь, что при ответе API с кодом 304 бот не вызывает '
+            'функцию `check_response`.'
+        )
+
+    def run_main_cycles(self, monkeypatch, random_message, homework_module,
+                        mock_response_get, cycles):
+        """
+        Run main() with mocked env vars, bot and API for a given number of
+        polling cycles and return the pauses passed to time.sleep().
+        """
+        monkeypatch.setattr(homework_module, 'PRACTICUM_TOKEN', 'sometoken')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_TOKEN', '1234:abcdefg')
+        monkeypatch.setattr(homework_module, 'TELEGRAM_CHAT_ID', '12345')
+        monkeypatch.setattr(homework_module, 'conditional_headers', {})
+        get_mock_telegram_bot(monkeypatch, random_message)
+
+        slept = []
+
+        def sleep_to_interrupt(secs):
+            slept.append(secs)
+            if len(slept) >= cycles:
+                raise utils.BreakInfiniteLoop('break')
+
+        monkeypatch.setattr(requests, 'get', mock_response_get)
+        monkeypatch.setattr(time, 'sleep', sleep_to_interrupt)
+        try:
+            homework_module.main()
+        except utils.BreakInfiniteLoop:
+            pass
+        return slept
+
+    def test_main_backs_off_on_errors(self, monkeypatch, random_timestamp,
+                                      random_message, homework_module):
+        failures = 4
+        requests_sent = []
+
+        def mock_response_get(*args, **kwargs):
+            requests_sent.append(kwargs)
+            if len(requests_sent) <= failures:
+                raise requests.RequestException('Something wrong')
+            return utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+
+        slept = self.run_main_cycles(
+            monkeypatch,
+            random_message,
+            homework_module,
+            mock_response_get,
+            cycles=failures + 1
+        )
+
+        max_period = homework_module.MAX_RETRY_PERIOD
+        expected = [
+            min(self.RETRY_PERIOD * 2 ** attempt, max_period)
+            for attempt in range(1, failures + 1)
+        ] + [self.RETRY_PERIOD]
+        assert slept == expected, (
+            'Убедитесь, что при ошибках пауза между запросами к API '
+            'удваивается, не превышает `MAX_RETRY_PERIOD` и сбрасывается '
+            'до `RETRY_PERIOD` после успешного запроса.'
+        )
+
+    def test_main_resends_validators_while_no_new_statuses(
+            self, monkeypatch, random_timestamp, random_message,
+            homework_module
+    ):
+        etag = '"a1b2c3"'
+        requests_sent = []
+
+        def mock_response_get(*args, **kwargs):
+            requests_sent.append(kwargs)
+            response = utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp, **kwargs
+            )
+            response.headers = {'ETag': etag}
+            return response
+
+        self.run_main_cycles(
+            monkeypatch,
+            random_message,
+            homework_module,
+            mock_response_get,
+            cycles=2
+        )
+
+        first, second = requests_sent
+        assert second['params'] == first['params'], (
+            'Убедитесь, что пока в ответе API нет новых статусов, бот '
+            'повторяет запрос с тем же `from_date`.'
+        )
+        assert second['headers'].get('If-None-Match') == etag, (
+            'Убедитесь, что при повторном запросе с тем же `from_date` '
+            'бот передает `ETag` из прошлого ответа.'
+        )
+
+    def test_main_drops_validators_on_rejected_response(
+            self, monkeypatch, random_timestamp, random_message,
+            homework_module
+    ):
+        invalid_data = {
+            'homeworks': {'homework_name': 'hw123', 'status': 'approved'},
+            'current_date': random_timestamp
+        }
+        requests_sent = []
+
+        def mock_response_get(*args, **kwargs):
+            requests_sent.append(kwargs)
+            response = utils.MockResponseGET(
+                *args, random_timestamp=random_timestamp,
+                data=invalid_data, **kwargs
+            )
+            response.headers = {'ETag': '"a1b2c3"'}
+            return response
+
+        self.run_main_cycles(
+            monkeypatch,
+            random_message,
+            homework_module,
+            mock_response_get,
+            cycles=2
+        )
+
+        assert 'If-None-Match' not in requests_sent[1]['headers'], (
+            'Убедитесь, что после ошибки обработки ответа API бот не '
+            'передает его `ETag` в следующем запросе: иначе ответ 304 '
+            'скроет ошибку.'
+        )
+
     def test_docstrings(self, homework_module):
         for func in self.HOMEWORK_FUNC_WITH_PARAMS_QTY:
             utils.check_docstring(homework_module, func)
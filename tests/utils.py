@@ -89,6 +89,7 @@ class MockResponseGET:
         self.status_code = http_status
         self.reason = ''
         self.text = ''
+        self.headers = {}
         default_data = {
             'homeworks': [],
             'current_date': self.random_timestamp